@@ -4,12 +4,33 @@ from __future__ import annotations
 
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.entity import Entity
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import (
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CAPABILITIES_SAVE_DELAY,
+    CONF_CACHE_TTL,
+    CONF_CALIBRATE_LINK,
+    CONF_CAPABILITY_SCAN,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CALIBRATE_LINK,
+    DEFAULT_CAPABILITY_SCAN,
+    DOMAIN,
+    SERVICE_SCAN_CAPABILITIES,
+    STORAGE_VERSION,
+)
+from .coordinator import NilanCoordinator
 from .device import Device
 
 PLATFORMS = [
@@ -25,6 +46,13 @@ PLATFORMS = [
 
 _LOGGER = logging.getLogger(__name__)
 
+SCAN_CAPABILITIES_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): str})
+
+
+def get_capabilities_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Get the store of the register capabilities learned for an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Nilan CTS602 Modbus TCP from a config entry."""
@@ -38,18 +66,92 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host_ip = entry.data["host_ip"]
     # board_type = entry.data["board_type"]
 
-    device = Device(hass, name, com_type, host_ip, host_port, unit_id)
+    cache_ttl = entry.options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL)
+    calibrate_link = entry.options.get(CONF_CALIBRATE_LINK, DEFAULT_CALIBRATE_LINK)
+    capability_scan = entry.options.get(CONF_CAPABILITY_SCAN, DEFAULT_CAPABILITY_SCAN)
+
+    device = Device(
+        hass, name, com_type, host_ip, host_port, unit_id, cache_ttl, calibrate_link
+    )
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+    identity = await store.async_load()
+    capabilities_store = get_capabilities_store(hass, entry.entry_id)
+    capabilities = await capabilities_store.async_load()
+    device.on_capabilities_changed = lambda: capabilities_store.async_delay_save(
+        lambda: device.capabilities, CAPABILITIES_SAVE_DELAY
+    )
     try:
-        await device.setup()
+        await device.setup(identity, capabilities, capability_scan)
     except ValueError as ex:
         raise ConfigEntryNotReady(f"Timeout while connecting {host_ip}") from ex
+    device.coordinator = NilanCoordinator(hass, entry, device)
+    if identity is None:
+        try:
+            await device.coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await device.async_close()
+            raise
+    else:
+        # The stored identity defines the entities, which fill in once polled.
+        await device.coordinator.async_refresh()
     hass.data[DOMAIN][entry.entry_id] = device
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if not hass.services.has_service(DOMAIN, SERVICE_SCAN_CAPABILITIES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SCAN_CAPABILITIES,
+            async_scan_capabilities,
+            schema=SCAN_CAPABILITIES_SCHEMA,
+        )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if identity is None:
+        await store.async_save(device.identity)
+    else:
+        entry.async_create_background_task(
+            hass,
+            async_confirm_identity(hass, entry, device, store),
+            f"{DOMAIN} {name} confirm identity",
+        )
     # entry.async_on_unload(entry.async_on_state_change())
     return True
 
 
+async def async_confirm_identity(
+    hass: HomeAssistant, entry: ConfigEntry, device: Device, store: Store
+) -> None:
+    """Confirm a stored device identity and reload the entry if it changed."""
+    try:
+        identity = await device.async_read_identity()
+    except ValueError:
+        _LOGGER.debug("Could not confirm identity of %s", device.get_device_name)
+        return
+    if identity != device.identity:
+        _LOGGER.info("Identity of %s has changed, reloading", device.get_device_name)
+        await store.async_save(identity)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+async def async_scan_capabilities(call: ServiceCall) -> None:
+    """Scan the registers a device supports and reload its entry."""
+    hass = call.hass
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    device = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(device, Device):
+        raise ServiceValidationError(f"{entry_id} is not a loaded Nilan device")
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if not entry.options.get(CONF_CAPABILITY_SCAN, DEFAULT_CAPABILITY_SCAN):
+        raise ServiceValidationError(
+            f"Capability scan is not enabled in the options of {device.get_device_name}"
+        )
+    if not await device.async_scan_capabilities():
+        raise HomeAssistantError(
+            f"Capability scan of {device.get_device_name} was interrupted"
+        )
+    await get_capabilities_store(hass, entry_id).async_save(device.capabilities)
+    hass.config_entries.async_schedule_reload(entry_id)
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Migrate old entry."""
     _LOGGER.debug("Migrating from version %s", config_entry.version)
@@ -58,20 +160,55 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         new = {**config_entry.data}
         new.update({"com_type": "tcp"})
         new.update({"board_type": "CTS602"})
-        config_entry.version = 2
-        hass.config_entries.async_update_entry(config_entry, data=new)
+        hass.config_entries.async_update_entry(config_entry, data=new, version=2)
 
-    elif config_entry.version == 2:
+    if config_entry.version == 2:
         new = {**config_entry.data}
         new.update({"board_type": "CTS602"})
-        config_entry.version = 3
-        hass.config_entries.async_update_entry(config_entry, data=new)
+        hass.config_entries.async_update_entry(config_entry, data=new, version=3)
+
+    if config_entry.version == 3:
+        async_migrate_unique_ids(hass, config_entry)
+        hass.config_entries.async_update_entry(config_entry, version=4)
 
     _LOGGER.info("Migration to version %s successful", config_entry.version)
 
     return True
 
 
+@callback
+def async_migrate_unique_ids(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Namespace the entity and device IDs of an entry by its entry ID."""
+    prefix = f"{config_entry.entry_id}_"
+
+    @callback
+    def migrate_entity(entity_entry: er.RegistryEntry) -> dict | None:
+        if entity_entry.unique_id.startswith(prefix):
+            return None
+        return {"new_unique_id": prefix + entity_entry.unique_id}
+
+    er.async_migrate_entries(hass, config_entry.entry_id, migrate_entity)
+
+    device_registry = dr.async_get(hass)
+    for device_entry in dr.async_entries_for_config_entry(
+        device_registry, config_entry.entry_id
+    ):
+        device_registry.async_update_device(
+            device_entry.id, new_identifiers={(DOMAIN, config_entry.entry_id)}
+        )
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored identity and capabilities of a deleted entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await get_capabilities_store(hass, entry.entry_id).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     await hass.data[DOMAIN][entry.entry_id].async_close()
@@ -82,22 +219,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-class NilanEntity(Entity):
+class NilanEntity(CoordinatorEntity):
     """Nilan Entity."""
 
     def __init__(self, device: Device) -> None:
         """Initialize the instance."""
+        super().__init__(device.coordinator)
         self._device = device
 
+    async def async_added_to_hass(self) -> None:
+        """Apply the latest coordinator data when added."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return the entity ID namespaced by the config entry of the device."""
+        if self._attr_unique_id is None:
+            return None
+        return f"{self.coordinator.config_entry.entry_id}_{self._attr_unique_id}"
+
     @property
     def device_info(self):
         """Device Info."""
-        unique_id = self._device.get_device_name + self._device.get_device_type
-
         return {
             "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, unique_id),
+                # Config entry IDs are unique identifiers within a specific domain
+                (DOMAIN, self.coordinator.config_entry.entry_id),
             },
             "name": self._device.get_device_name,
             "manufacturer": "Nilan",
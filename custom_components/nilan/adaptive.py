@@ -0,0 +1,37 @@
+"""Adapts how often register blocks of Nilan devices are polled."""
+
+from __future__ import annotations
+
+
+class AdaptivePoller:
+    """Back off polling of register blocks whose values have been stable."""
+
+    def __init__(self, max_backoff: int) -> None:
+        """Create new poller reading every block each cycle."""
+        self._max_backoff = max_backoff
+        self._backoff = {}
+        self._due_in = {}
+
+    def get_due(self, blocks, pinned=()) -> list:
+        """Get the blocks to read this cycle and count down the others."""
+        due = []
+        for block in blocks:
+            if block in pinned or self._due_in.get(block, 0) <= 0:
+                due.append(block)
+            else:
+                self._due_in[block] -= 1
+        return due
+
+    def record(self, block, changed: bool) -> None:
+        """Record a block read, doubling the backoff if it did not change."""
+        if changed:
+            backoff = 1
+        else:
+            backoff = min(self._backoff.get(block, 1) * 2, self._max_backoff)
+        self._backoff[block] = backoff
+        self._due_in[block] = backoff - 1
+
+    def reset(self) -> None:
+        """Read every block again from the next cycle on."""
+        self._backoff.clear()
+        self._due_in.clear()
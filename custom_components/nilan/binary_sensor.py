@@ -8,6 +8,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
+from homeassistant.core import callback
 
 from .__init__ import NilanEntity
 from .const import DOMAIN
@@ -160,7 +161,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
                     for m in maps
                 ]
             )
-    async_add_entities(binary_sensors, update_before_add=True)
+    async_add_entities(binary_sensors)
 
 
 class NilanCTS602BinarySensor(BinarySensorEntity, NilanEntity):
@@ -180,6 +181,7 @@ class NilanCTS602BinarySensor(BinarySensorEntity, NilanEntity):
         """Init Binary Sensor."""
         super().__init__(device)
         self._attribute = attribute
+        self.coordinator_context = (attribute,)
         self._device = device
         self._attr_device_class = device_class
         self._attr_entity_category = entity_category
@@ -198,6 +200,8 @@ class NilanCTS602BinarySensor(BinarySensorEntity, NilanEntity):
             return self._on_icon
         return self._off_icon
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the binary sensor."""
-        self._attr_is_on = await getattr(self._device, self._attribute)()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_is_on = self.coordinator.data.get(self._attribute)
+        super()._handle_coordinator_update()
@@ -0,0 +1,45 @@
+"""Circuit breaker pausing requests to unresponsive Nilan devices."""
+
+from __future__ import annotations
+
+import time
+
+
+class CircuitBreaker:
+    """Open after consecutive failures and allow probes with exponential backoff."""
+
+    def __init__(self, threshold: int, min_backoff: float, max_backoff: float) -> None:
+        """Create new closed circuit breaker."""
+        self._threshold = threshold
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._backoff = min_backoff
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests should not be sent."""
+        return self._failures >= self._threshold
+
+    @property
+    def probe_due(self) -> bool:
+        """Return True if the backoff has elapsed and a probe may be sent."""
+        return time.monotonic() >= self._retry_at
+
+    def record_success(self) -> bool:
+        """Close the breaker, return True if it was open."""
+        was_open = self.is_open
+        self._failures = 0
+        self._backoff = self._min_backoff
+        return was_open
+
+    def record_failure(self) -> bool:
+        """Count a failure, return True if it opened the breaker."""
+        self._failures += 1
+        if self._failures < self._threshold:
+            return False
+        if self._failures > self._threshold:
+            self._backoff = min(self._backoff * 2, self._max_backoff)
+        self._retry_at = time.monotonic() + self._backoff
+        return self._failures == self._threshold
@@ -14,9 +14,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
     device = HomeAssistant.data[DOMAIN][config_entry.entry_id]
     for attribute in device.get_assigned("button"):
         if attribute in ("set_time"):
-            async_add_entities(
-                [NilanCTS602SyncTimeButton(device)], update_before_add=True
-            )
+            async_add_entities([NilanCTS602SyncTimeButton(device)])
 
 
 class NilanCTS602SyncTimeButton(ButtonEntity, NilanEntity):
@@ -34,6 +32,7 @@ class NilanCTS602SyncTimeButton(ButtonEntity, NilanEntity):
         self._attr_translation_key = "sync_time"
         self._attr_has_entity_name = True
         self._attr_unique_id = "sync_time"
+        self.coordinator_context = ()
 
     async def async_press(self) -> None:
         """Handle the button press."""
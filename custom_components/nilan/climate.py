@@ -9,6 +9,7 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 
 from .__init__ import NilanEntity
 from .const import DOMAIN
@@ -95,7 +96,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
         entities.append(
             NilanClimate(device, supported_features, extra_status_attributes)
         )
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class NilanClimate(NilanEntity, ClimateEntity):
@@ -125,68 +126,82 @@ class NilanClimate(NilanEntity, ClimateEntity):
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_supported_features = supported_featrures
         self._extra_status_attributes = extra_status_attributes
+        self.coordinator_context = (
+            "get_run_state",
+            "get_operation_mode",
+            "get_ventilation_step",
+            "get_air_exchange_mode",
+            "get_user_temperature_setpoint",
+            "get_control_temperature",
+            "get_humidity",
+            "get_user_humidity_setpoint",
+            "get_control_state",
+            "get_ventilation_state",
+            "get_supply_fan_level",
+        )
 
     async def async_set_fan_mode(self, fan_mode):
         """Set new target fan mode."""
-        await self._device.set_ventilation_step(int(fan_mode))
-        self.async_write_ha_state()
+        await self.coordinator.async_set("set_ventilation_step", int(fan_mode))
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new target preset mode."""
-        await self._device.set_air_exchange_mode(PRESET_TO_HVAC.get(preset_mode))
-        self.async_write_ha_state()
+        await self.coordinator.async_set(
+            "set_air_exchange_mode", PRESET_TO_HVAC.get(preset_mode)
+        )
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target operation mode."""
         if hvac_mode == HVACMode.OFF:
-            await self._device.set_run_state(False)
+            await self.coordinator.async_set("set_run_state", False)
         else:
             self._hvac_on = await self._device.get_run_state()
             if not self._hvac_on:
-                await self._device.set_run_state(True)
-            await self._device.set_operation_mode(STATE_TO_HVAC_MODE.get(hvac_mode))
+                await self.coordinator.async_set("set_run_state", True)
+            await self.coordinator.async_set(
+                "set_operation_mode", STATE_TO_HVAC_MODE.get(hvac_mode)
+            )
         self._attr_hvac_mode = hvac_mode
         self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
-        await self._device.set_user_temperature_setpoint(kwargs[ATTR_TEMPERATURE])
-        self.async_write_ha_state()
+        await self.coordinator.async_set(
+            "set_user_temperature_setpoint", kwargs[ATTR_TEMPERATURE]
+        )
 
     async def async_set_humidity(self, humidity):
         """Set new target temperature."""
-        await self._device.set_user_humidity_setpoint(humidity)
-        self.async_write_ha_state()
+        await self.coordinator.async_set("set_user_humidity_setpoint", humidity)
 
-    async def async_update(self) -> None:
-        """Update sensor values."""
-        self._hvac_on = await self._device.get_run_state()
-        self._attr_fan_mode = str(await self._device.get_ventilation_step())
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        self._hvac_on = data.get("get_run_state")
+        self._attr_fan_mode = str(data.get("get_ventilation_step"))
 
         if self._attr_supported_features & ClimateEntityFeature.TARGET_TEMPERATURE:
-            self._attr_target_temperature = (
-                await self._device.get_user_temperature_setpoint()
-            )
-            self._attr_current_temperature = (
-                await self._device.get_control_temperature()
-            )
+            self._attr_target_temperature = data.get("get_user_temperature_setpoint")
+            self._attr_current_temperature = data.get("get_control_temperature")
 
         if self._attr_supported_features & ClimateEntityFeature.TARGET_HUMIDITY:
-            self._attr_current_humidity = await self._device.get_humidity()
-            self._attr_target_humidity = await self._device.get_user_humidity_setpoint()
+            self._attr_current_humidity = data.get("get_humidity")
+            self._attr_target_humidity = data.get("get_user_humidity_setpoint")
 
         if self._attr_supported_features & ClimateEntityFeature.PRESET_MODE:
             self._attr_preset_mode = HVAC_TO_PRESET.get(
-                await self._device.get_air_exchange_mode()
+                data.get("get_air_exchange_mode")
             )
 
-        control_state = await self._device.get_control_state()
+        control_state = data.get("get_control_state")
         if control_state is None:
+            super()._handle_coordinator_update()
             return
 
         if self._extra_status_attributes:
-            ventilation_state = await self._device.get_ventilation_state()
-            fan_supply_level = await self._device.get_supply_fan_level()
+            ventilation_state = data.get("get_ventilation_state")
+            fan_supply_level = data.get("get_supply_fan_level")
             if ventilation_state == 3:
                 self._attr_hvac_action = HVACAction.DRYING
             elif control_state in (7, 17):
@@ -210,5 +225,6 @@ class NilanClimate(NilanEntity, ClimateEntity):
             self._attr_hvac_mode = HVACAction.OFF
         else:
             self._attr_hvac_mode = HVAC_MODE_TO_STATE.get(
-                await self._device.get_operation_mode()
+                data.get("get_operation_mode")
             )
+        super()._handle_coordinator_update()
@@ -0,0 +1,64 @@
+"""Decodes and encodes the register values of Nilan devices."""
+
+from __future__ import annotations
+
+import datetime
+from array import array
+
+
+def _to_char(value: int) -> str:
+    """Convert a display byte to a character."""
+    if value == 0xDF:
+        return "°"
+    return chr(value)
+
+
+def unpack_block(registers: list[int]) -> tuple[array, array]:
+    """Convert block registers to unsigned and signed arrays in one step."""
+    unsigned = array("H", registers)
+    return unsigned, array("h", unsigned.tobytes())
+
+
+def decode_value(register, unsigned: array, signed: array, offset: int = 0):
+    """Decode a register descriptor at offset of an unpacked block."""
+    if register.value_type == "text":
+        return "".join(
+            _to_char(value & 0x00FF) + _to_char(value >> 8)
+            for value in unsigned[offset : offset + register.count]
+        )
+    if register.value_type == "datetime":
+        second, minute, hour, day, month, year = unsigned[offset : offset + 6]
+        return datetime.datetime(year, month, day, hour, minute, second)
+
+    value = (signed if register.signed else unsigned)[offset]
+    if register.mask is not None:
+        value &= register.mask
+    if register.value_type == "bool":
+        return value != 0
+    if register.value_type == "timedelta":
+        return datetime.timedelta(seconds=value)
+    if register.value_type == "float":
+        return float(value) / register.scale
+    return value
+
+
+def decode_version(values: list[int], dotted: bool) -> str:
+    """Decode a controller software version string."""
+    if dotted:
+        return ".".join(
+            (chr(value >> 8) + chr(value & 0x00FF)).replace(" ", "") for value in values
+        )
+    return "".join(chr(value & 0x00FF) + chr(value >> 8) for value in values).replace(
+        " ", ""
+    )
+
+
+def encode_value(register, value) -> int | None:
+    """Encode a value for a register descriptor, None if it is not writable."""
+    if value not in register.options and (
+        register.limits is None or not register.limits[0] <= value <= register.limits[1]
+    ):
+        return None
+    if register.value_type == "bool":
+        return 1 if value else 0
+    return round(value * register.scale) & 0xFFFF
@@ -10,9 +10,21 @@ from pymodbus.exceptions import ModbusException
 import voluptuous as vol
 
 from homeassistant import config_entries
-
-from .const import DOMAIN
+from homeassistant.core import callback
+
+from .const import (
+    CONF_CACHE_TTL,
+    CONF_CALIBRATE_LINK,
+    CONF_CAPABILITY_SCAN,
+    CONF_WRITE_SETTLE_TIME,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CALIBRATE_LINK,
+    DEFAULT_CAPABILITY_SCAN,
+    DEFAULT_WRITE_SETTLE_TIME,
+    DOMAIN,
+)
 from .device import CTS602_DEVICE_TYPES
+from .identity import IDENTITY_INPUT_ADDRESS, IDENTITY_INPUT_COUNT, decode_identity
 from .registers import CTS602HoldingRegisters
 
 STEP_TCP_DATA_SCHEMA = vol.Schema(
@@ -55,25 +67,25 @@ async def async_validate_device(com_type, port, unit_id, address: str | None) ->
         result = await client.read_holding_registers(
             CTS602HoldingRegisters.control_type, count=1, device_id=int(unit_id)
         )
+        inputs = await client.read_input_registers(
+            IDENTITY_INPUT_ADDRESS, count=IDENTITY_INPUT_COUNT, device_id=int(unit_id)
+        )
     except ModbusException as value_error:
         client.close()
         raise ValueError("cannot_connect") from value_error
-    if hasattr(result, "message"):
+    if hasattr(result, "message") or hasattr(inputs, "message"):
         client.close()
         raise ValueError("invalid_response")
-    if len(result.registers) == 0:
+    if len(result.registers) == 0 or len(inputs.registers) < IDENTITY_INPUT_COUNT:
         client.close()
         raise ValueError("invalid_response")
-    value_output = int.from_bytes(
-        result.registers[0].to_bytes(2, "little", signed=False),
-        "little",
-        signed=False,
-    )
-    if value_output not in CTS602_DEVICE_TYPES:
+    identity = decode_identity(result.registers[0], inputs.registers)
+    if identity["hw_type"] not in CTS602_DEVICE_TYPES:
         _LOGGER.debug(
             "Device Type %s not found in supported devices list",
-            str(value_output),
+            str(identity["hw_type"]),
         )
+        client.close()
         raise ValueError("unsupported_device")
     client.close()
 
@@ -81,10 +93,16 @@ async def async_validate_device(com_type, port, unit_id, address: str | None) ->
 class NilanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Nilan CTS602 Modbus TCP."""
 
-    VERSION = 3
+    VERSION = 4
 
     data: Optional[dict(str, Any)]
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
+        """Get the options flow for this handler."""
+        return NilanOptionsFlow()
+
     async def async_step_user(self, user_input: Optional[dict(str, Any)] = None):
         """Invoke when a user initiates a flow via the user interface."""
         return await self.async_step_menu(user_input)
@@ -144,3 +162,41 @@ class NilanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="serial", data_schema=STEP_SERIAL_DATA_SCHEMA, errors=errors
         )
+
+
+class NilanOptionsFlow(config_entries.OptionsFlow):
+    """Handle Nilan options."""
+
+    async def async_step_init(self, user_input: Optional[dict(str, Any)] = None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+        options_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_CACHE_TTL,
+                    default=self.config_entry.options.get(
+                        CONF_CACHE_TTL, DEFAULT_CACHE_TTL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONF_WRITE_SETTLE_TIME,
+                    default=self.config_entry.options.get(
+                        CONF_WRITE_SETTLE_TIME, DEFAULT_WRITE_SETTLE_TIME
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Required(
+                    CONF_CALIBRATE_LINK,
+                    default=self.config_entry.options.get(
+                        CONF_CALIBRATE_LINK, DEFAULT_CALIBRATE_LINK
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_CAPABILITY_SCAN,
+                    default=self.config_entry.options.get(
+                        CONF_CAPABILITY_SCAN, DEFAULT_CAPABILITY_SCAN
+                    ),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=options_schema)
@@ -1,3 +1,48 @@
 """Constants for the Nilan integration."""
 
 DOMAIN = "nilan"
+
+DEFAULT_SCAN_INTERVAL = 30
+SLOW_POLL_INTERVAL = 300
+# Scan interval while the control state is transitional (heating, cooling or
+# defrosting), and the fast blocks are read every cycle.
+TRANSITION_SCAN_INTERVAL = 10
+TRANSITIONAL_CONTROL_STATES = (7, 8, 11, 17)
+# Maximum number of cycles between reads of a fast block that does not change.
+ADAPTIVE_MAX_BACKOFF = 4
+
+CONF_CACHE_TTL = "cache_ttl"
+DEFAULT_CACHE_TTL = 5
+CONF_WRITE_SETTLE_TIME = "write_settle_time"
+DEFAULT_WRITE_SETTLE_TIME = 1.0
+CONF_CALIBRATE_LINK = "calibrate_link"
+DEFAULT_CALIBRATE_LINK = False
+CONF_CAPABILITY_SCAN = "capability_scan"
+DEFAULT_CAPABILITY_SCAN = False
+
+STORAGE_VERSION = 1
+
+# Seconds to wait for a connection or the answer to a Modbus transaction, and
+# the upper bound the client itself waits for any transaction.
+MODBUS_TIMEOUT = 1
+MODBUS_CLIENT_TIMEOUT = 10
+
+# Seconds to wait before saving newly learned illegal registers.
+CAPABILITIES_SAVE_DELAY = 10
+
+SERVICE_SCAN_CAPABILITIES = "scan_capabilities"
+
+# Consecutive failed requests before a device is treated as offline, and the
+# range of the backoff between probes of an offline device in seconds.
+BREAKER_THRESHOLD = 3
+BREAKER_MIN_BACKOFF = 30
+BREAKER_MAX_BACKOFF = 600
+
+# Seconds to collect setter writes before sending them as merged requests.
+WRITE_BATCH_WINDOW = 0.05
+
+# Seconds after the last write before the written registers are read back.
+WRITE_CONFIRM_DELAY = 2.0
+
+# Poll cycles of devices on the same gateway or serial port that may run at once.
+FLEET_GATEWAY_CONCURRENCY = 1
@@ -0,0 +1,237 @@
+"""Data update coordinator for Nilan devices."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    SLOW_POLL_INTERVAL,
+    TRANSITION_SCAN_INTERVAL,
+    TRANSITIONAL_CONTROL_STATES,
+    WRITE_CONFIRM_DELAY,
+)
+from .fleet import async_get_fleet
+from .register_map import CTS602_REGISTER_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NilanCoordinator(DataUpdateCoordinator):
+    """Poll all entities of a Nilan device in one batched read."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, device) -> None:
+        """Create new coordinator for device."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=device.get_device_name,
+            update_interval=datetime.timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        )
+        self.device = device
+        self._fleet = async_get_fleet(hass)
+        self._last_slow_poll = None
+        self._scan_interval = DEFAULT_SCAN_INTERVAL
+        self._poll = None
+        self._overrun = False
+        self._poll_duration = None
+        self._skipped_polls = 0
+        self._written = set()
+        self._changes = set()
+        self._notified_success = None
+        self._context_listeners = {}
+        self._attribute_listeners = {}
+        self._remove_dispatcher = None
+        self.changed_attributes = None
+        self._confirm_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_CONFIRM_DELAY,
+            immediate=False,
+            function=self._async_confirm_writes,
+        )
+
+    def _get_due_tiers(self) -> tuple[str, ...]:
+        """Get the poll tiers to read in this update."""
+        if self.data is None:
+            return ("fast", "slow", "static")
+        if time.monotonic() - self._last_slow_poll >= SLOW_POLL_INTERVAL:
+            return ("fast", "slow")
+        return ("fast",)
+
+    async def _async_update_data(self) -> dict:
+        """Run a poll cycle, skipping it if the last one overran or still runs."""
+        if self._poll is None and self._overrun:
+            self._overrun = False
+            return self._skip_poll(self.data)
+        if self._poll is not None:
+            return self._skip_poll(await asyncio.shield(self._poll))
+        self._poll = asyncio.ensure_future(self._async_poll())
+        self._poll.add_done_callback(self._clear_poll)
+        return await asyncio.shield(self._poll)
+
+    def _skip_poll(self, data: dict | None) -> dict:
+        """Count a skipped poll cycle and keep data."""
+        self._skipped_polls += 1
+        _LOGGER.debug("Skipping poll cycle of %s", self.device.get_device_name)
+        if data is None:
+            raise UpdateFailed(f"Could not read {self.device.get_device_name}")
+        return self._merge({**data, "skipped_polls": self._skipped_polls})
+
+    def _clear_poll(self, _task) -> None:
+        """Allow the next poll cycle to start."""
+        self._poll = None
+
+    async def _async_poll(self) -> dict:
+        """Fetch the register blocks and decode the attributes of the due tiers."""
+        tiers = self._get_due_tiers()
+        gateway = self.device.transport_key
+        async with self._fleet.slot(gateway):
+            start = time.monotonic()
+            data = await self.device.async_poll(
+                tiers, self._scan_interval != TRANSITION_SCAN_INTERVAL
+            )
+            self._poll_duration = time.monotonic() - start
+            self._fleet.record_poll(
+                gateway,
+                self.config_entry.entry_id,
+                self._poll_duration,
+                DEFAULT_SCAN_INTERVAL,
+            )
+        if self._poll_duration > self._scan_interval:
+            _LOGGER.warning(
+                "Poll cycle of %s took %.1f s, skipping the next one",
+                self.device.get_device_name,
+                self._poll_duration,
+            )
+            self._overrun = True
+        # The poll only returns changed attributes, look in the merged snapshot.
+        control_state = {**(self.data or {}), **(data or {})}.get("get_control_state")
+        if control_state in TRANSITIONAL_CONTROL_STATES:
+            self._scan_interval = TRANSITION_SCAN_INTERVAL
+        else:
+            self._scan_interval = DEFAULT_SCAN_INTERVAL
+        interval = self._scan_interval
+        if self.data is None:
+            # Offset the first scheduled poll so devices set up together spread out.
+            interval += self._fleet.get_offset(self.config_entry.entry_id, interval)
+        self.update_interval = datetime.timedelta(seconds=interval)
+        if data is None:
+            raise UpdateFailed(f"Could not read {self.device.get_device_name}")
+        if "slow" in tiers:
+            self._last_slow_poll = time.monotonic()
+        return self._merge(
+            {
+                **data,
+                **self.device.get_transport_metrics(),
+                "poll_duration": round(self._poll_duration, 2),
+                "skipped_polls": self._skipped_polls,
+            }
+        )
+
+    def _merge(self, data: dict) -> dict:
+        """Merge data into a copy of the current data and track what changed."""
+        current = self.data or {}
+        self._changes.update(
+            attribute
+            for attribute, value in data.items()
+            if attribute not in current or current[attribute] != value
+        )
+        return {**current, **data}
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context=None
+    ) -> CALLBACK_TYPE:
+        """Listen for updates, only of the attributes in context if it is given."""
+        if context is None:
+            return super().async_add_listener(update_callback, context)
+        if self._remove_dispatcher is None:
+            self._remove_dispatcher = super().async_add_listener(
+                self._async_dispatch_changes
+            )
+        token = object()
+        self._context_listeners[token] = update_callback
+        for attribute in context:
+            self._attribute_listeners.setdefault(attribute, {})[token] = update_callback
+
+        @callback
+        def remove_listener() -> None:
+            self._context_listeners.pop(token)
+            for attribute in context:
+                listeners = self._attribute_listeners[attribute]
+                listeners.pop(token)
+                if not listeners:
+                    self._attribute_listeners.pop(attribute)
+            if not self._context_listeners:
+                self._remove_dispatcher()
+                self._remove_dispatcher = None
+
+        return remove_listener
+
+    @callback
+    def _async_dispatch_changes(self) -> None:
+        """Notify the listeners of the changed attributes through the index."""
+        if self.data is None:
+            # Entities created from a stored identity wait for the first data.
+            return
+        if self.changed_attributes is None:
+            listeners = list(self._context_listeners.values())
+        else:
+            listeners = {
+                token: update_callback
+                for attribute in self.changed_attributes
+                for token, update_callback in self._attribute_listeners.get(
+                    attribute, {}
+                ).items()
+            }.values()
+        for update_callback in listeners:
+            update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners of the attributes changed since the last update."""
+        if self._notified_success is not True or not self.last_update_success:
+            self.changed_attributes = None
+        else:
+            self.changed_attributes = self._changes
+        self._changes = set()
+        self._notified_success = self.last_update_success
+        super().async_update_listeners()
+
+    async def async_set(self, setter: str, value) -> bool:
+        """Write value and update the entities bound to its register at once."""
+        if not await getattr(self.device, setter)(value):
+            return False
+        attribute = f"get_{setter[4:]}"
+        if attribute not in CTS602_REGISTER_MAP or self.data is None:
+            await self.async_request_refresh()
+            return True
+        self.data = self._merge({attribute: value})
+        self.async_update_listeners()
+        self._written.add(attribute)
+        await self._confirm_debouncer.async_call()
+        return True
+
+    async def _async_confirm_writes(self) -> None:
+        """Read back all registers written since the last confirmation."""
+        attributes, self._written = self._written, set()
+        data = await self.device.async_read_attributes(attributes)
+        if data and self.data is not None:
+            self.data = self._merge(data)
+            self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a scheduled confirmation read."""
+        await super().async_shutdown()
+        self._fleet.remove(self.device.transport_key, self.config_entry.entry_id)
+        self._confirm_debouncer.async_shutdown()
@@ -0,0 +1,71 @@
+"""Spreads the polls of many Nilan devices over the scan interval."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import zlib
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, FLEET_GATEWAY_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+FLEET = f"{DOMAIN}_fleet"
+
+
+class FleetScheduler:
+    """Coordinate the poll cycles of all Nilan devices of a Home Assistant."""
+
+    def __init__(self) -> None:
+        """Create new empty fleet."""
+        self._slots = {}
+        self._durations = {}
+        self._over_budget = set()
+
+    @staticmethod
+    def get_offset(entry_id: str, interval: float) -> float:
+        """Get the deterministic offset of a device poll within the interval."""
+        return zlib.crc32(entry_id.encode()) % 1000 / 1000 * interval
+
+    def slot(self, gateway: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent poll cycles on a gateway."""
+        if gateway not in self._slots:
+            self._slots[gateway] = asyncio.Semaphore(FLEET_GATEWAY_CONCURRENCY)
+        return self._slots[gateway]
+
+    def get_budget(self, gateway: str) -> float:
+        """Get the seconds one poll of every device on a gateway takes."""
+        return sum(self._durations.get(gateway, {}).values())
+
+    def record_poll(
+        self, gateway: str, entry_id: str, duration: float, interval: float
+    ) -> None:
+        """Record a poll duration and report when the gateway is over budget."""
+        self._durations.setdefault(gateway, {})[entry_id] = duration
+        budget = self.get_budget(gateway)
+        if budget > interval and gateway not in self._over_budget:
+            self._over_budget.add(gateway)
+            _LOGGER.warning(
+                "Polling the %s devices on %s takes %.1f s, "
+                "longer than the %s s scan interval",
+                len(self._durations[gateway]),
+                gateway,
+                budget,
+                interval,
+            )
+        elif budget <= interval and gateway in self._over_budget:
+            self._over_budget.discard(gateway)
+            _LOGGER.info("Polling the devices on %s fits the scan interval", gateway)
+
+    def remove(self, gateway: str, entry_id: str) -> None:
+        """Forget the poll durations of an unloaded device."""
+        self._durations.get(gateway, {}).pop(entry_id, None)
+
+
+def async_get_fleet(hass: HomeAssistant) -> FleetScheduler:
+    """Get the fleet scheduler, creating it if needed."""
+    if FLEET not in hass.data:
+        hass.data[FLEET] = FleetScheduler()
+    return hass.data[FLEET]
@@ -0,0 +1,38 @@
+"""Decodes the identity of Nilan devices from one register snapshot."""
+
+from __future__ import annotations
+
+from .codec import decode_version, unpack_block
+from .registers import CTS602InputRegisters
+
+# The contiguous input registers from bus_version (0) to info_hw_type, so the
+# offsets into the snapshot equal the register addresses.
+IDENTITY_INPUT_ADDRESS = CTS602InputRegisters.bus_version
+IDENTITY_INPUT_COUNT = CTS602InputRegisters.info_hw_type + 1
+
+
+def decode_identity(control_type: int, inputs: list[int]) -> dict:
+    """Decode hardware type, flavour and versions from the identity registers."""
+    hw_type = unpack_block([control_type])[1][0]
+    unsigned, signed = unpack_block(inputs)
+    bus_version = signed[CTS602InputRegisters.bus_version]
+
+    air_geo_type = 0
+    if hw_type == 44:
+        minor = unsigned[CTS602InputRegisters.app_version_minor]
+        version = (chr(minor >> 8) + chr(minor & 0x00FF)).replace(" ", "")
+        if version == "1":
+            air_geo_type = 1
+        elif version == "2":
+            air_geo_type = 2
+
+    major = CTS602InputRegisters.app_version_major
+    return {
+        "hw_type": hw_type,
+        "bus_version": bus_version,
+        "air_geo_type": air_geo_type,
+        "sw_version": decode_version(
+            unsigned[major : major + 3], bus_version > 19 or air_geo_type != 0
+        ),
+        "hw_version": unsigned[CTS602InputRegisters.info_hw_type],
+    }
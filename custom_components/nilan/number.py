@@ -11,10 +11,12 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
 from .__init__ import NilanEntity
-from .const import DOMAIN
+from .const import CONF_WRITE_SETTLE_TIME, DEFAULT_WRITE_SETTLE_TIME, DOMAIN
 
 Map = namedtuple(
     "map", "name set_attr entity_category min_value max_value step mode unit icon"
@@ -612,6 +614,9 @@ ATTRIBUTE_TO_NUMBERS = {
 async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
     """Set up the number platform."""
     device = HomeAssistant.data[DOMAIN][config_entry.entry_id]
+    settle_time = config_entry.options.get(
+        CONF_WRITE_SETTLE_TIME, DEFAULT_WRITE_SETTLE_TIME
+    )
     numbers = []
     for attribute in device.get_assigned("number"):
         if attribute in ATTRIBUTE_TO_NUMBERS:
@@ -630,11 +635,12 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
                         m.mode,
                         m.unit,
                         m.icon,
+                        settle_time,
                     )
                     for m in maps
                 ]
             )
-    async_add_entities(numbers, update_before_add=True)
+    async_add_entities(numbers)
 
 
 class NilanCTS602Number(NumberEntity, NilanEntity):
@@ -653,10 +659,12 @@ class NilanCTS602Number(NumberEntity, NilanEntity):
         mode,
         unit,
         icon,
+        settle_time,
     ) -> None:
         """Init Number."""
         super().__init__(device)
         self._attribute = attribute
+        self.coordinator_context = (attribute,)
         self._device = device
         self._set_attr = set_attr
         self._attr_entity_category = entity_category
@@ -670,11 +678,42 @@ class NilanCTS602Number(NumberEntity, NilanEntity):
         self._attr_translation_key = self._name
         self._attr_has_entity_name = True
         self._attr_unique_id = self._name
+        self._settle_time = settle_time
+        self._pending_value = None
+        self._cancel_pending_write = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending write."""
+        if self._cancel_pending_write is not None:
+            self._cancel_pending_write()
+        await super().async_will_remove_from_hass()
 
     async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        await getattr(self._device, self._set_attr)(int(value))
+        """Show the new value and write it once it has settled."""
+        self._pending_value = value
+        self._attr_native_value = value
+        self.async_write_ha_state()
+        if self._cancel_pending_write is not None:
+            self._cancel_pending_write()
+        self._cancel_pending_write = async_call_later(
+            self.hass, self._settle_time, self._async_write_pending_value
+        )
+
+    async def _async_write_pending_value(self, _now=None) -> None:
+        """Write the latest pending value."""
+        self._cancel_pending_write = None
+        value = self._pending_value
+        written = await self.coordinator.async_set(self._set_attr, int(value))
+        if self._pending_value != value:
+            return
+        self._pending_value = None
+        if not written:
+            self._attr_native_value = (self.coordinator.data or {}).get(self._attribute)
+            self.async_write_ha_state()
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        self._attr_native_value = await getattr(self._device, self._attribute)()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._pending_value is None:
+            self._attr_native_value = self.coordinator.data.get(self._attribute)
+        super()._handle_coordinator_update()
@@ -0,0 +1,135 @@
+"""Plans Modbus block reads for Nilan devices."""
+
+from __future__ import annotations
+
+from collections import namedtuple
+
+# Maximum number of registers in a single read request (Modbus PDU limit).
+MAX_BLOCK_COUNT = 125
+# Maximum number of registers in a single write request.
+MAX_WRITE_COUNT = 123
+# Unused registers that may be read over to merge two neighbouring blocks.
+DEFAULT_MAX_GAP = 8
+# Read samples needed before a link cost is calibrated from measured latencies.
+MIN_CALIBRATION_SAMPLES = 20
+
+RegisterBlock = namedtuple("block", "table address count")
+# Seconds a link spends per transaction and per register read in it.
+LinkCost = namedtuple("link_cost", "transaction register")
+
+# RS485 at 19200 baud: about 1 ms per register, tens of ms turnaround.
+RTU_LINK_COST = LinkCost(0.030, 0.001)
+# TCP to RS485 bridges add a network round trip to every transaction.
+TCP_LINK_COST = LinkCost(0.060, 0.001)
+
+
+def get_max_gap(cost: LinkCost, max_count: int = MAX_BLOCK_COUNT) -> int:
+    """Get the largest gap that is cheaper to read over than to split at."""
+    if cost.register <= 0:
+        return max_count
+    return min(int(cost.transaction / cost.register), max_count)
+
+
+class LatencyModel:
+    """Fit a link cost to the measured durations of block reads."""
+
+    def __init__(self, default: LinkCost) -> None:
+        """Create new model without samples."""
+        self.default = default
+        self._samples = 0
+        self._sum_count = 0.0
+        self._sum_duration = 0.0
+        self._sum_count_squared = 0.0
+        self._sum_product = 0.0
+
+    def record(self, count: int, duration: float) -> None:
+        """Record the duration of a read of count registers."""
+        self._samples += 1
+        self._sum_count += count
+        self._sum_duration += duration
+        self._sum_count_squared += count * count
+        self._sum_product += count * duration
+
+    @property
+    def cost(self) -> LinkCost:
+        """Return the least squares link cost, the default until calibrated."""
+        if self._samples < MIN_CALIBRATION_SAMPLES:
+            return self.default
+        spread = self._samples * self._sum_count_squared - self._sum_count**2
+        if spread <= 0:
+            return self.default
+        register = (
+            self._samples * self._sum_product - self._sum_count * self._sum_duration
+        ) / spread
+        transaction = (self._sum_duration - register * self._sum_count) / self._samples
+        if register <= 0 or transaction <= 0:
+            return self.default
+        return LinkCost(transaction, register)
+
+
+def plan_blocks(
+    registers,
+    max_gap: int = DEFAULT_MAX_GAP,
+    max_count: int = MAX_BLOCK_COUNT,
+    illegal=frozenset(),
+) -> list[RegisterBlock]:
+    """Group registers into as few contiguous block reads as possible.
+
+    Gaps are never read over if they contain an illegal (table, address).
+    """
+    spans = {}
+    for register in registers:
+        spans.setdefault(register.table, set()).add(
+            (register.address, register.address + register.count)
+        )
+
+    blocks = []
+    for table in sorted(spans):
+        start = end = None
+        for first, last in sorted(spans[table]):
+            if start is not None:
+                if (
+                    first - end <= max_gap
+                    and max(end, last) - start <= max_count
+                    and not any(
+                        (table, address) in illegal for address in range(end, first)
+                    )
+                ):
+                    end = max(end, last)
+                    continue
+                blocks.append(RegisterBlock(table, start, end - start))
+            start, end = first, last
+        blocks.append(RegisterBlock(table, start, end - start))
+    return blocks
+
+
+def find_block(blocks, table: str, address: int, count: int = 1):
+    """Find the block covering a register span, None if no block does."""
+    for block in blocks:
+        if (
+            block.table == table
+            and block.address <= address
+            and address + count <= block.address + block.count
+        ):
+            return block
+    return None
+
+
+def plan_writes(
+    writes: dict[int, int], fill: dict[int, int], max_count: int = MAX_WRITE_COUNT
+) -> list[tuple[int, list[int]]]:
+    """Group register writes into contiguous runs, bridging gaps from fill."""
+    runs = []
+    for address in sorted(writes):
+        if runs:
+            start, values = runs[-1]
+            end = start + len(values)
+            gap = range(end, address)
+            if address - start < max_count and all(
+                register in fill for register in gap
+            ):
+                values.extend(fill[register] for register in gap)
+                values.append(writes[address])
+                continue
+        runs.append((address, [writes[address]]))
+    return runs
@@ -0,0 +1,1103 @@
+"""Describes the Modbus register and encoding of every device attribute."""
+
+from collections import namedtuple
+
+from .registers import CTS602HoldingRegisters, CTS602InputRegisters
+
+# Poll tiers: "fast" values are read every scan interval, "slow" configuration
+# values every few minutes or after a write and "static" identity values once.
+# Values are decoded as value_type ("int", "float", "bool", "timedelta", "text",
+# "datetime" or "version") after applying signed, mask and scale. Registers with
+# options or limits are writable with any value in options or within limits.
+Register = namedtuple(
+    "register",
+    "table address count tier value_type signed scale mask options limits",
+    defaults=("fast", "int", False, 1, None, (), None),
+)
+
+CTS602_REGISTER_MAP = {
+    "get_machine_type": Register(
+        "holding", CTS602HoldingRegisters.control_type, 1, tier="static", signed=True
+    ),
+    "get_bus_version": Register(
+        "input", CTS602InputRegisters.bus_version, 1, tier="static", signed=True
+    ),
+    "get_after_heating_type": Register(
+        "holding", CTS602HoldingRegisters.air_heat_type, 1, tier="slow"
+    ),
+    "get_air_heat_select": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_heat_select,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4),
+    ),
+    "get_controller_software_version": Register(
+        "input",
+        CTS602InputRegisters.app_version_major,
+        3,
+        tier="static",
+        value_type="version",
+    ),
+    "get_controller_hardware_version": Register(
+        "input", CTS602InputRegisters.info_hw_type, 1, tier="static"
+    ),
+    "get_display_text_1": Register(
+        "input", CTS602InputRegisters.display_text_1_2, 4, value_type="text"
+    ),
+    "get_display_text_2": Register(
+        "input", CTS602InputRegisters.display_text_9_10, 4, value_type="text"
+    ),
+    "get_user_menu_state": Register(
+        "holding",
+        CTS602HoldingRegisters.user_user_menu_open,
+        1,
+        tier="slow",
+        options=(0, 1, 2),
+    ),
+    "get_anode_state": Register("input", CTS602InputRegisters.hot_water_anode_state, 1),
+    "get_supply_air_after_heating": Register(
+        "holding",
+        CTS602HoldingRegisters.air_heat_select_set,
+        1,
+        tier="slow",
+        options=(0, 1),
+    ),
+    "get_supply_power_at_level_1": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_inlet_spd_1,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_supply_power_at_level_2": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_inlet_spd_2,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_supply_power_at_level_3": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_inlet_spd_3,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_supply_power_at_level_4": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_inlet_spd_4,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_return_power_at_level_1": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_spd_1,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_return_power_at_level_2": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_spd_2,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_return_power_at_level_3": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_spd_3,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_return_power_at_level_4": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_spd_4,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(20, 100),
+    ),
+    "get_defrost_ventilation_level": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_fans,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 1, 2),
+    ),
+    "get_central_heat_type": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_heat_type,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 1, 2, 3),
+    ),
+    "get_central_heat_select": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_heat_select,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 1, 2),
+    ),
+    "get_fan_startup_delay": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_start_delay,
+        1,
+        tier="slow",
+        limits=(0, 240),
+    ),
+    "get_actual_vent_set": Register("input", CTS602InputRegisters.air_flow_vent_set, 1),
+    "get_supply_fan_level": Register(
+        "input", CTS602InputRegisters.air_flow_inlet_act, 1
+    ),
+    "get_return_fan_level": Register(
+        "input", CTS602InputRegisters.air_flow_exhaust_act, 1
+    ),
+    "get_return_fan_speed": Register(
+        "holding",
+        CTS602HoldingRegisters.output_exhaust_speed,
+        1,
+        value_type="float",
+        scale=100,
+    ),
+    "get_supply_fan_speed": Register(
+        "holding",
+        CTS602HoldingRegisters.output_inlet_speed,
+        1,
+        value_type="float",
+        scale=100,
+    ),
+    "get_co2_low_limit_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_co2_lim_lo,
+        1,
+        tier="slow",
+        limits=(400, 750),
+    ),
+    "get_co2_high_limit_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_co2_lim_hi,
+        1,
+        tier="slow",
+        limits=(650, 2500),
+    ),
+    "get_room_master_temperature": Register(
+        "input",
+        CTS602InputRegisters.air_temp_temp_room,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_central_heating_setpoint": Register(
+        "input",
+        CTS602InputRegisters.central_heat_heat_ext_set,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_exchanger_efficiency": Register(
+        "input", CTS602InputRegisters.air_temp_eff_pct, 1, value_type="float", scale=100
+    ),
+    "get_hps_compressor_capacity": Register(
+        "input",
+        CTS602InputRegisters.hps_heat_pump_capacity_act,
+        1,
+        value_type="float",
+        scale=10,
+    ),
+    "get_control_temperature": Register(
+        "input",
+        CTS602InputRegisters.air_temp_temp_control,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_after_heating_element_capacity": Register(
+        "input",
+        CTS602InputRegisters.output_air_heat_cap,
+        1,
+        value_type="float",
+        scale=100,
+    ),
+    "get_external_heating_offset": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_heat_extern,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(0, 10),
+    ),
+    "get_t0_controller_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t0_controller,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t1_intake_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t1_intake,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t2_inlet_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t2_inlet,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t3_exhaust_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t3_exhaust,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t4_outlet": Register(
+        "input",
+        CTS602InputRegisters.input_t4_outlet,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t5_condenser_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t5_cond,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t6_evaporator_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t6_evap,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t7_inlet_temperature_after_heater": Register(
+        "input",
+        CTS602InputRegisters.input_t7_inlet,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t8_outdoor_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t8_outdoor,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t9_heater_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t9_heater,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t10_external_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t10_extern,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t11_electric_water_heater_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t11_top,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t12_compressor_water_heater_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t12_bottom,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t13_return_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t13_return,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t14_supply_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t14_supply,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t15_user_panel_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t15_room,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t16_sacrificial_anode_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t16,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_t17_preheater_temperature": Register(
+        "input",
+        CTS602InputRegisters.input_t17_pre_heat,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_hps_t16_return_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t16_return,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t17_supply_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t17_supply,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t18_tank_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t18_tank,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t20_ambient_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t20_ambient,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t21_shw_top_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t21_shw_top,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t22_shw_bottom_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t22_shw_bot,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_t35_pressure_pipe_temperature": Register(
+        "input",
+        CTS602InputRegisters.hps_input_t35_pres_tube,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_hot_water_setpoint_actual": Register(
+        "input",
+        CTS602InputRegisters.hps_hot_water_set_point_act,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_heating_setpoint_actual": Register(
+        "input",
+        CTS602InputRegisters.hps_heating_set_point_act,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_hps_output_compvolt1": Register(
+        "input",
+        CTS602InputRegisters.hps_output_comp_volt1,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+    ),
+    "get_co2_sensor_value": Register(
+        "input", CTS602InputRegisters.air_qual_co2, 1, value_type="float", signed=True
+    ),
+    "get_average_humidity": Register(
+        "input",
+        CTS602InputRegisters.air_qual_rh_avg,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+    ),
+    "get_user_temperature_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.control_temp_set,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 30),
+    ),
+    "get_defrost_start_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_temp_start,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(-10, 0),
+    ),
+    "get_defrost_stop_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_temp_stop,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(2, 12),
+    ),
+    "get_low_room_temperature_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_room_low,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(0, 20),
+    ),
+    "get_low_temperature_curve": Register(
+        "holding",
+        CTS602HoldingRegisters.compressor_cond_temp_min,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(15, 46),
+    ),
+    "get_high_temperature_curve": Register(
+        "holding",
+        CTS602HoldingRegisters.compressor_cond_temp_max,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(39, 60),
+    ),
+    "get_low_temperature_compressor_start_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_min_cpr,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(0, 15),
+    ),
+    "get_low_outdoor_temperature_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_winter_temp,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        limits=(-20, 10),
+    ),
+    "get_scalding_protection_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.hot_water_temp_cpr_max,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(60, 80),
+    ),
+    "get_user_humidity_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_rh_lim_lo,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(15, 45),
+    ),
+    "get_electric_water_heater_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.hot_water_temp_set_t11,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+        options=(0,),
+        limits=(5, 85),
+    ),
+    "get_compressor_water_heater_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.hot_water_temp_set_t12,
+        1,
+        value_type="float",
+        signed=True,
+        scale=100,
+        options=(0,),
+        limits=(5, 60),
+    ),
+    "get_hps_water_heater_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.hps_hot_water_set_point,
+        1,
+        value_type="float",
+        signed=True,
+        scale=10,
+        options=(0,),
+        limits=(5, 70),
+    ),
+    "get_hps_heating_setpoint_min": Register(
+        "holding",
+        CTS602HoldingRegisters.hps_heating_set_point_min,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=10,
+        options=(0,),
+        limits=(0, 70),
+    ),
+    "get_ch_min_supply_temperature": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_supply_min,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 40),
+    ),
+    "get_ch_max_supply_temperature": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_supply_max,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(0, 100),
+    ),
+    "get_min_supply_air_summer_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_min_sum,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 50),
+    ),
+    "get_min_supply_air_winter_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_min_win,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 50),
+    ),
+    "get_max_supply_air_summer_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_max_sum,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 50),
+    ),
+    "get_max_supply_air_winter_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_max_win,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 50),
+    ),
+    "get_summer_state_change_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_temp_summer,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(5, 30),
+    ),
+    "get_operation_mode": Register(
+        "holding", CTS602HoldingRegisters.control_mode_set, 1, options=(0, 1, 2, 3)
+    ),
+    "get_pre_heater_defrost_select": Register(
+        "holding",
+        CTS602HoldingRegisters.preheat_defrost,
+        1,
+        tier="slow",
+        options=(0, 1),
+    ),
+    "get_pre_heater_temp_set": Register(
+        "holding",
+        CTS602HoldingRegisters.preheat_temp_set,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5),
+    ),
+    "get_high_humidity_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_rh_vent_hi,
+        1,
+        tier="slow",
+        options=(0, 2, 3, 4),
+    ),
+    "get_max_high_humidity_vent_time": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_time_out,
+        1,
+        tier="slow",
+        limits=(1, 180),
+    ),
+    "get_user_function_1_time": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_time_set,
+        1,
+        tier="slow",
+        options=(0,),
+        limits=(15, 480),
+    ),
+    "get_user_function_2_time": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_2_time_set,
+        1,
+        tier="slow",
+        options=(0,),
+        limits=(15, 480),
+    ),
+    "get_user_function_1_temperature": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_temp_set,
+        1,
+        tier="slow",
+        limits=(5, 30),
+    ),
+    "get_user_function_2_temperature": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_2_temp_set,
+        1,
+        tier="slow",
+        limits=(5, 30),
+    ),
+    "get_user_function_1_offset": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_offs_set,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(-10, 10),
+    ),
+    "get_user_function_2_offset": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_2_offs_set,
+        1,
+        tier="slow",
+        signed=True,
+        limits=(-10, 10),
+    ),
+    "get_supply_heating_pid_time": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_reg_time,
+        1,
+        tier="slow",
+        limits=(0, 25),
+    ),
+    "get_minimum_defrost_time": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_t6_min_run_sec,
+        1,
+        tier="slow",
+        limits=(10, 120),
+    ),
+    "get_maximum_outlet_defrost_time": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_dur_max_exh,
+        1,
+        tier="slow",
+        limits=(5, 60),
+    ),
+    "get_maximum_compressor_defrost_time": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_dur_max_cpr,
+        1,
+        tier="slow",
+        limits=(2, 60),
+    ),
+    "get_time_between_defrost": Register(
+        "holding",
+        CTS602HoldingRegisters.defrost_block_minutes,
+        1,
+        tier="slow",
+        limits=(15, 720),
+    ),
+    "get_compressor_stop_time": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_cpr_restart,
+        1,
+        tier="slow",
+        limits=(0, 3600),
+    ),
+    "get_hmi_language": Register(
+        "holding",
+        CTS602HoldingRegisters.user_language,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5, 6, 7),
+    ),
+    "get_circulation_pump_mode": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_circ_pump_mode,
+        1,
+        tier="slow",
+        options=(0, 1),
+    ),
+    "get_low_humidity_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_rh_vent_lo,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 1, 2, 3, 4),
+    ),
+    "get_air_quality_control_type": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_type,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 1, 2),
+    ),
+    "get_cooling_setpoint": Register(
+        "holding",
+        CTS602HoldingRegisters.air_temp_cool_set,
+        1,
+        tier="slow",
+        signed=True,
+        options=(0, 2, 3, 4, 5, 6, 7, 8),
+    ),
+    "get_cooling_mode_ventilation_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_cool_vent,
+        1,
+        tier="slow",
+        options=(0, 2, 3, 4),
+    ),
+    "get_co2_ventilation_high_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_qual_co2_vent_hi,
+        1,
+        tier="slow",
+        options=(0, 2, 3, 4),
+    ),
+    "get_alarm_count": Register(
+        "input", CTS602InputRegisters.alarm_status, 1, mask=0x03
+    ),
+    "get_hps_alarm_count": Register("input", CTS602InputRegisters.hps_alarm_count, 1),
+    "get_legionella_day": Register(
+        "holding",
+        CTS602HoldingRegisters.hot_water_legio_type,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5, 6, 7),
+    ),
+    "get_hps_season_mode": Register(
+        "holding",
+        CTS602HoldingRegisters.hps_param_season_mode,
+        1,
+        tier="slow",
+        options=(0, 1, 2),
+    ),
+    "get_air_filter_alarm_interval": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_filt_alm_type,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5),
+    ),
+    "get_time_in_control_state": Register(
+        "input", CTS602InputRegisters.control_sec_in_state, 1, value_type="timedelta"
+    ),
+    "get_days_since_air_filter_change": Register(
+        "input", CTS602InputRegisters.air_flow_since_filt_day, 1, tier="slow"
+    ),
+    "get_days_to_air_filter_change": Register(
+        "input", CTS602InputRegisters.air_flow_to_filt_day, 1, tier="slow"
+    ),
+    "get_air_exchange_mode": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_air_exch_mode,
+        1,
+        signed=True,
+        options=(0, 1, 2),
+    ),
+    "get_summer_state": Register("input", CTS602InputRegisters.air_temp_is_summer, 1),
+    "get_ventilation_step": Register(
+        "holding", CTS602HoldingRegisters.control_vent_set, 1, options=(0, 1, 2, 3, 4)
+    ),
+    "get_min_supply_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_inlet_min,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4),
+    ),
+    "get_min_return_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_min,
+        1,
+        tier="slow",
+        options=(1, 2, 3, 4),
+    ),
+    "get_max_return_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_exhaust_max,
+        1,
+        tier="slow",
+        options=(3, 4),
+    ),
+    "get_low_outdoor_temperature_ventilation_step": Register(
+        "holding",
+        CTS602HoldingRegisters.air_flow_winter_vent,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3),
+    ),
+    "get_electric_water_heater_state": Register(
+        "holding", CTS602HoldingRegisters.output_water_heat, 1, value_type="bool"
+    ),
+    "get_circulation_pump_state": Register(
+        "holding", CTS602HoldingRegisters.output_cen_circ_pump, 1, value_type="bool"
+    ),
+    "get_heater_relay_1_state": Register(
+        "holding", CTS602HoldingRegisters.output_cen_heat_1, 1, value_type="bool"
+    ),
+    "get_heater_relay_2_state": Register(
+        "holding", CTS602HoldingRegisters.output_cen_heat_2, 1, value_type="bool"
+    ),
+    "get_heater_relay_3_state": Register(
+        "holding", CTS602HoldingRegisters.output_cen_heat_3, 1, value_type="bool"
+    ),
+    "get_compressor_priority": Register(
+        "holding",
+        CTS602HoldingRegisters.hot_water_priority,
+        1,
+        tier="slow",
+        options=(0, 1),
+    ),
+    "get_central_heat_supply_curve": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_curve_select,
+        1,
+        tier="slow",
+        limits=(1, 10),
+    ),
+    "get_supply_heater_delay": Register(
+        "holding", CTS602HoldingRegisters.air_heat_delay, 1, tier="slow", limits=(0, 30)
+    ),
+    "get_ventilation_state": Register(
+        "input", CTS602InputRegisters.air_flow_vent_state, 1
+    ),
+    "get_control_state": Register(
+        "input", CTS602InputRegisters.control_state_display, 1
+    ),
+    "get_hps_heat_pump_state": Register(
+        "input", CTS602InputRegisters.hps_heat_pump_state, 1
+    ),
+    "get_humidity": Register(
+        "input", CTS602InputRegisters.air_qual_rh, 1, value_type="float", scale=100
+    ),
+    "get_central_heat_supply_curve_offset": Register(
+        "holding",
+        CTS602HoldingRegisters.central_heat_supply_offset,
+        1,
+        tier="slow",
+        value_type="float",
+        signed=True,
+        scale=100,
+        limits=(-15, 10),
+    ),
+    "get_run_state": Register(
+        "holding",
+        CTS602HoldingRegisters.control_run_set,
+        1,
+        value_type="bool",
+        options=(False, True),
+    ),
+    "get_hps_main_switch": Register(
+        "holding",
+        CTS602HoldingRegisters.hps_param_main_switch,
+        1,
+        value_type="bool",
+        options=(False, True),
+    ),
+    "get_alarm_1_code": Register(
+        "input", CTS602InputRegisters.alarm_list_1_id, 1, mask=0x7F
+    ),
+    "get_alarm_2_code": Register(
+        "input", CTS602InputRegisters.alarm_list_2_id, 1, mask=0x7F
+    ),
+    "get_alarm_3_code": Register(
+        "input", CTS602InputRegisters.alarm_list_3_id, 1, mask=0x7F
+    ),
+    "get_hps_alarm_1_code": Register("input", CTS602InputRegisters.hps_alarm_code1, 1),
+    "get_hps_alarm_2_code": Register("input", CTS602InputRegisters.hps_alarm_code2, 1),
+    "get_hps_alarm_3_code": Register("input", CTS602InputRegisters.hps_alarm_code3, 1),
+    "get_smoke_alarm_state": Register(
+        "input", CTS602InputRegisters.input_smoke, 1, value_type="bool"
+    ),
+    "get_user_function_1_state": Register(
+        "holding", CTS602HoldingRegisters.output_user_func, 1, value_type="bool"
+    ),
+    "get_user_function_2_state": Register(
+        "holding", CTS602HoldingRegisters.output_user_func_2, 1, value_type="bool"
+    ),
+    "get_display_led_1_state": Register(
+        "input", CTS602InputRegisters.display_led_1, 1, value_type="bool"
+    ),
+    "get_display_led_2_state": Register(
+        "input", CTS602InputRegisters.display_led_2, 1, value_type="bool"
+    ),
+    "get_compressor_state": Register(
+        "holding", CTS602HoldingRegisters.output_compressor, 1, value_type="bool"
+    ),
+    "get_co2_present": Register(
+        "input",
+        CTS602InputRegisters.air_qual_co2_enable,
+        1,
+        tier="static",
+        value_type="bool",
+    ),
+    "get_defrost_state": Register(
+        "holding", CTS602HoldingRegisters.output_defrosting, 1, value_type="bool"
+    ),
+    "get_bypass_flap_state": Register(
+        "input", CTS602InputRegisters.air_bypass_is_open, 1, value_type="bool"
+    ),
+    "get_user_function_1_mode": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_func_set,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5, 6),
+    ),
+    "get_user_function_2_mode": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_2_func_set,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4, 5, 6),
+    ),
+    "get_user_function_1_ventilation_step": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_vent_set,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4),
+    ),
+    "get_user_function_2_ventilation_step": Register(
+        "holding",
+        CTS602HoldingRegisters.program_user_2_vent_set,
+        1,
+        tier="slow",
+        options=(0, 1, 2, 3, 4),
+    ),
+    "get_time": Register(
+        "holding", CTS602HoldingRegisters.time_second, 6, value_type="datetime"
+    ),
+}
+
+# Attributes that are not read themselves but whose entities poll other attributes.
+CTS602_ATTRIBUTE_DEPENDENCIES = {
+    "alarm_reset": ("get_alarm_1_code", "get_alarm_2_code", "get_alarm_3_code"),
+    "hps_alarm_reset": (
+        "get_hps_alarm_1_code",
+        "get_hps_alarm_2_code",
+        "get_hps_alarm_3_code",
+    ),
+}
+
+# Writable configuration registers, which may be rewritten with their cached
+# value to merge neighbouring writes into one request. Fast control registers
+# can be changed at the panel at any time and are never rewritten.
+CTS602_FILL_REGISTERS = frozenset(
+    register.address
+    for register in CTS602_REGISTER_MAP.values()
+    if register.table == "holding"
+    and register.tier == "slow"
+    and (register.options or register.limits)
+) - frozenset(
+    register.address + offset
+    for register in CTS602_REGISTER_MAP.values()
+    if register.table == "holding" and register.tier == "fast"
+    for offset in range(register.count)
+)
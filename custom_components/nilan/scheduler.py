@@ -0,0 +1,68 @@
+"""Schedules Modbus transactions of Nilan devices by priority."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import heapq
+import itertools
+
+# Priority classes, lower values are sent first.
+PRIORITY_WRITE = 0
+PRIORITY_CONFIRM = 1
+PRIORITY_LIVE = 2
+PRIORITY_SLOW = 3
+PRIORITY_BULK = 4
+
+
+class RequestScheduler:
+    """Run transactions on one transport one at a time, highest priority first.
+
+    Transactions of the same priority from different clients take turns, so a
+    client queueing many requests does not hold back the others on the bus.
+    """
+
+    def __init__(self) -> None:
+        """Create new idle scheduler."""
+        self._waiting = []
+        self._order = itertools.count()
+        self._busy = False
+        self._round = 0
+        self._client_rounds = {}
+
+    async def async_run(
+        self, priority: int, call: Callable[[], Awaitable], client=None
+    ):
+        """Wait for the transport, then run call and return its result."""
+        await self._async_acquire(priority, client)
+        try:
+            return await call()
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int, client) -> None:
+        """Wait until no transaction is running and no more urgent one waits."""
+        if not self._busy:
+            self._busy = True
+            return
+        turn_round = max(self._client_rounds.get(client, 0), self._round) + 1
+        self._client_rounds[client] = turn_round
+        turn = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, turn_round, next(self._order), turn))
+        try:
+            await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the transport to the most urgent waiting transaction."""
+        while self._waiting:
+            _, turn_round, _, turn = heapq.heappop(self._waiting)
+            if not turn.done():
+                self._round = turn_round
+                turn.set_result(None)
+                return
+        self._busy = False
+        self._client_rounds.clear()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import namedtuple
 
 from homeassistant.components.select import SelectEntity
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 
 from .__init__ import NilanEntity
@@ -323,7 +324,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
                     for m in maps
                 ]
             )
-    async_add_entities(selects, update_before_add=True)
+    async_add_entities(selects)
 
 
 class NilanCTS602Select(SelectEntity, NilanEntity):
@@ -342,6 +343,7 @@ class NilanCTS602Select(SelectEntity, NilanEntity):
         """Init Select."""
         super().__init__(device)
         self._attribute = attribute
+        self.coordinator_context = (attribute,)
         self._device = device
         self._set_attr = set_attr
         self._attr_entity_category = entity_category
@@ -362,11 +364,13 @@ class NilanCTS602Select(SelectEntity, NilanEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await getattr(self._device, self._set_attr)(int(option))
+        await self.coordinator.async_set(self._set_attr, int(option))
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the select."""
-        self._attr_current_option = str(await getattr(self._device, self._attribute)())
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_current_option = str(self.coordinator.data.get(self._attribute))
+        super()._handle_coordinator_update()
 
 
 class NilanCTS602AlarmSelect(SelectEntity, NilanEntity):
@@ -394,6 +398,7 @@ class NilanCTS602AlarmSelect(SelectEntity, NilanEntity):
         self._attribute_1 = attribute_1
         self._attribute_2 = attribute_2
         self._attribute_3 = attribute_3
+        self.coordinator_context = (attribute_1, attribute_2, attribute_3)
         self._set_attr = set_attr
         self._all_alarms_code = all_alarms_code
 
@@ -406,16 +411,17 @@ class NilanCTS602AlarmSelect(SelectEntity, NilanEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await getattr(self._device, self._set_attr)(int(option))
+        await self.coordinator.async_set(self._set_attr, int(option))
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the select."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
         self._attr_current_option = None
         self._attr_options = None
         options = []
-        option1 = await getattr(self._device, self._attribute_1)()
-        option2 = await getattr(self._device, self._attribute_2)()
-        option3 = await getattr(self._device, self._attribute_3)()
+        option1 = self.coordinator.data.get(self._attribute_1)
+        option2 = self.coordinator.data.get(self._attribute_2)
+        option3 = self.coordinator.data.get(self._attribute_3)
         if option1 != 0:
             options.append(str(option1))
         if option2 != 0:
@@ -425,3 +431,4 @@ class NilanCTS602AlarmSelect(SelectEntity, NilanEntity):
         if len(options) > 1:
             options.append(str(self._all_alarms_code))
         self._attr_options = options
+        super()._handle_coordinator_update()
@@ -15,13 +15,16 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 
 from .__init__ import NilanEntity
 from .const import DOMAIN
 
 Map = namedtuple(
-    "map", "name default_unit device_class state_class entity_category icon enabled"
+    "map",
+    "name default_unit device_class state_class entity_category icon enabled deadband",
+    defaults=(None,),
 )
 
 ATTRIBUTE_TO_SENSORS = {
@@ -34,6 +37,7 @@ ATTRIBUTE_TO_SENSORS = {
             EntityCategory.DIAGNOSTIC,
             None,
             True,
+            0.5,
         )
     ],
     "get_t1_intake_temperature": [
@@ -577,6 +581,54 @@ ATTRIBUTE_TO_SENSORS = {
     ],
 }
 
+COORDINATOR_SENSORS = {
+    "poll_duration": Map(
+        "poll_duration",
+        UnitOfTime.SECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        EntityCategory.DIAGNOSTIC,
+        "mdi:timer-outline",
+        False,
+    ),
+    "skipped_polls": Map(
+        "skipped_polls",
+        None,
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        EntityCategory.DIAGNOSTIC,
+        "mdi:debug-step-over",
+        False,
+    ),
+    "modbus_latency": Map(
+        "modbus_latency",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        EntityCategory.DIAGNOSTIC,
+        "mdi:timer-sand",
+        False,
+    ),
+    "modbus_timeouts": Map(
+        "modbus_timeouts",
+        None,
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        EntityCategory.DIAGNOSTIC,
+        "mdi:timer-alert-outline",
+        False,
+    ),
+    "modbus_exceptions": Map(
+        "modbus_exceptions",
+        None,
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        EntityCategory.DIAGNOSTIC,
+        "mdi:alert-circle-outline",
+        False,
+    ),
+}
+
 
 async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
     """Set up the sensor platform."""
@@ -597,11 +649,27 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
                         m.entity_category,
                         m.icon,
                         m.enabled,
+                        m.deadband,
                     )
                     for m in maps
                 ]
             )
-    async_add_entities(sensors, update_before_add=True)
+    sensors.extend(
+        NilanCTS602Sensor(
+            device,
+            attribute,
+            m.name,
+            m.default_unit,
+            m.device_class,
+            m.state_class,
+            m.entity_category,
+            m.icon,
+            m.enabled,
+            m.deadband,
+        )
+        for attribute, m in COORDINATOR_SENSORS.items()
+    )
+    async_add_entities(sensors)
 
 
 class NilanCTS602Sensor(SensorEntity, NilanEntity):
@@ -618,10 +686,12 @@ class NilanCTS602Sensor(SensorEntity, NilanEntity):
         entity_category,
         icon,
         enabled,
+        deadband=None,
     ) -> None:
         """Init Sensor."""
         super().__init__(device)
         self._attribute = attribute
+        self.coordinator_context = (attribute,)
         self._device = device
         self._attr_native_unit_of_measurement = default_unit
         self._attr_device_class = device_class
@@ -630,10 +700,22 @@ class NilanCTS602Sensor(SensorEntity, NilanEntity):
         self._attr_icon = icon
         self._name = name
         self._attr_entity_registry_enabled_default = enabled
+        self._deadband = deadband
         self._attr_has_entity_name = True
         self._attr_translation_key = self._name
         self._attr_unique_id = self._name
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        self._attr_native_value = await getattr(self._device, self._attribute)()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        value = self.coordinator.data.get(self._attribute)
+        if (
+            self._deadband is not None
+            and self.coordinator.changed_attributes is not None
+            and value is not None
+            and self._attr_native_value is not None
+            and abs(value - self._attr_native_value) < self._deadband
+        ):
+            return
+        self._attr_native_value = value
+        super()._handle_coordinator_update()
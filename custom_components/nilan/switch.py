@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections import namedtuple
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 
 from .__init__ import NilanEntity
@@ -62,7 +63,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
                     for m in maps
                 ]
             )
-    async_add_entities(switches, update_before_add=True)
+    async_add_entities(switches)
 
 
 class NilanCTS602Switch(SwitchEntity, NilanEntity):
@@ -83,6 +84,7 @@ class NilanCTS602Switch(SwitchEntity, NilanEntity):
         """Init Switch."""
         super().__init__(device)
         self._attribute = attribute
+        self.coordinator_context = (attribute,)
         self._device = device
         self._set_attr = set_attr
         self._attr_entity_category = entity_category
@@ -104,12 +106,14 @@ class NilanCTS602Switch(SwitchEntity, NilanEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await getattr(self._device, self._set_attr)(int(self._off_value))
+        await self.coordinator.async_set(self._set_attr, int(self._off_value))
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await getattr(self._device, self._set_attr)(int(self._on_value))
+        await self.coordinator.async_set(self._set_attr, int(self._on_value))
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        self._attr_is_on = await getattr(self._device, self._attribute)()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_is_on = self.coordinator.data.get(self._attribute)
+        super()._handle_coordinator_update()
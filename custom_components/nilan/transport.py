@@ -0,0 +1,180 @@
+"""Shares Modbus connections between Nilan devices on the same gateway or port."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, MODBUS_CLIENT_TIMEOUT, MODBUS_TIMEOUT
+from .planner import RTU_LINK_COST, TCP_LINK_COST, LatencyModel
+from .scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSPORTS = f"{DOMAIN}_transports"
+
+# Modbus exception code of a request for an address the device does not implement.
+ILLEGAL_DATA_ADDRESS = 2
+
+
+class ModbusCallError(Exception):
+    """Modbus transaction that was not answered or answered with an exception."""
+
+    def __init__(self, message: str, exception_code: int | None = None) -> None:
+        """Create new error, with the exception code if the device answered."""
+        super().__init__(message)
+        self.exception_code = exception_code
+
+
+def get_transport_key(com_type, host_ip: str | None, host_port) -> str:
+    """Get the key of the connection a device is reached through."""
+    if com_type == "serial":
+        return str(host_port)
+    return f"{host_ip}:{host_port}"
+
+
+class ModbusTransport:
+    """Modbus connection multiplexing the unit IDs of one gateway or port."""
+
+    def __init__(self, hass: HomeAssistant, key: str, com_type, host_ip, host_port):
+        """Create new unconnected transport."""
+        self.hass = hass
+        self.key = key
+        if com_type == "serial":
+            self._client = AsyncModbusSerialClient(
+                port=host_port,
+                stopbits=1,
+                bytesize=8,
+                parity="E",
+                baudrate=19200,
+                timeout=MODBUS_CLIENT_TIMEOUT,
+                retries=0,
+            )
+        else:
+            self._client = AsyncModbusTcpClient(
+                host_ip,
+                port=int(host_port),
+                timeout=MODBUS_CLIENT_TIMEOUT,
+                retries=0,
+            )
+        self._scheduler = RequestScheduler()
+        self.latency = LatencyModel(
+            RTU_LINK_COST if com_type == "serial" else TCP_LINK_COST
+        )
+        self.timeouts = 0
+        self.exceptions = 0
+        self.last_latency = None
+        self._users = 0
+        self._setup = None
+
+    async def async_acquire(self) -> bool:
+        """Connect on first use, False if the connection could not be set up."""
+        self._users += 1
+        if self._setup is None:
+            self._setup = asyncio.ensure_future(self._async_setup())
+        if await asyncio.shield(self._setup):
+            return True
+        await self.async_release()
+        return False
+
+    async def _async_setup(self) -> bool:
+        """Connect the Modbus client."""
+        try:
+            # The client timeout only bounds transactions, connect fails fast.
+            async with asyncio.timeout(MODBUS_TIMEOUT):
+                connected = await self._client.connect()
+        except TimeoutError:
+            connected = False
+        if not connected:
+            _LOGGER.error("Could not connect to %s", self.key)
+            return False
+        _LOGGER.debug("Connected to %s", self.key)
+        return True
+
+    async def async_release(self) -> None:
+        """Close the connection once its last device has released it."""
+        self._users -= 1
+        if self._users > 0:
+            return
+        transports = self.hass.data.get(TRANSPORTS, {})
+        if transports.get(self.key) is self:
+            transports.pop(self.key)
+        self._client.close()
+
+    async def async_pb_call(
+        self,
+        unit_id: int,
+        address: int,
+        value,
+        use_call: str,
+        priority: int,
+        timeout: float = MODBUS_TIMEOUT,
+    ):
+        """Run one Modbus transaction for a unit in its turn on the bus."""
+        return await self._scheduler.async_run(
+            priority,
+            lambda: self._async_timed_call(unit_id, address, value, use_call, timeout),
+            unit_id,
+        )
+
+    async def _async_timed_call(
+        self, unit_id: int, address: int, value, use_call: str, timeout: float
+    ):
+        """Run one Modbus transaction and record its latency."""
+        if use_call == "holding":
+            request = self._client.read_holding_registers(
+                address, count=value, device_id=unit_id
+            )
+        elif use_call == "input":
+            request = self._client.read_input_registers(
+                address, count=value, device_id=unit_id
+            )
+        elif use_call == "write_registers":
+            request = self._client.write_registers(address, value, device_id=unit_id)
+        else:
+            request = self._client.write_register(address, value, device_id=unit_id)
+
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                result = await request
+        except (ModbusException, TimeoutError) as err:
+            # pymodbus reports the cancellation of a request as a ModbusException.
+            if asyncio.current_task().cancelling():
+                raise asyncio.CancelledError from err
+            if deadline.expired():
+                self.timeouts += 1
+                raise ModbusCallError(
+                    f"Unit {unit_id} on {self.key} did not answer within {timeout} s"
+                ) from err
+            raise ModbusCallError(str(err)) from err
+        self.last_latency = time.monotonic() - start
+
+        if result.isError():
+            exception_code = getattr(result, "exception_code", None)
+            self.exceptions += 1
+            raise ModbusCallError(
+                f"Unit {unit_id} on {self.key} answered {use_call} {address} "
+                f"with exception code {exception_code}",
+                exception_code,
+            )
+        if use_call in ("holding", "input"):
+            self.latency.record(value, self.last_latency)
+        return result
+
+
+def async_get_transport(
+    hass: HomeAssistant, com_type, host_ip: str | None, host_port
+) -> ModbusTransport:
+    """Get the shared transport of a gateway or port, creating it if needed."""
+    key = get_transport_key(com_type, host_ip, host_port)
+    transports = hass.data.setdefault(TRANSPORTS, {})
+    if key not in transports:
+        transports[key] = ModbusTransport(hass, key, com_type, host_ip, host_port)
+    return transports[key]
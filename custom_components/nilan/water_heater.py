@@ -10,6 +10,7 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntityFeature,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 
 from .__init__ import NilanEntity
 from .const import DOMAIN
@@ -32,7 +33,7 @@ async def async_setup_entry(HomeAssistant, config_entry, async_add_entities):
     ):
         entities.append(NilanTopWaterHeater(device))
         entities.append(NilanBottomWaterHeater(device))
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class NilanTopWaterHeater(NilanEntity, WaterHeaterEntity):
@@ -52,29 +53,36 @@ class NilanTopWaterHeater(NilanEntity, WaterHeaterEntity):
         self._attr_translation_key = "top_water_heater"
         self._attr_has_entity_name = True
         self._attr_unique_id = "top_water_heater"
+        self.coordinator_context = (
+            "get_electric_water_heater_setpoint",
+            "get_t11_electric_water_heater_temperature",
+            "get_electric_water_heater_state",
+        )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
-        await self._device.set_electric_water_heater_setpoint(kwargs[ATTR_TEMPERATURE])
-        self.async_write_ha_state()
+        await self.coordinator.async_set(
+            "set_electric_water_heater_setpoint", kwargs[ATTR_TEMPERATURE]
+        )
 
     async def async_set_operation_mode(self, operation_mode):
         """Set operation mode."""
         if operation_mode == STATE_OFF:
-            await self._device.set_electric_water_heater_setpoint(0)
+            await self.coordinator.async_set("set_electric_water_heater_setpoint", 0)
         else:
-            await self._device.set_electric_water_heater_setpoint(self._previous_temp)
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Update sensor values."""
-        self._attr_target_temperature = (
-            await self._device.get_electric_water_heater_setpoint()
-        )
-        self._attr_current_temperature = (
-            await self._device.get_t11_electric_water_heater_temperature()
+            await self.coordinator.async_set(
+                "set_electric_water_heater_setpoint", self._previous_temp
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        self._attr_target_temperature = data.get("get_electric_water_heater_setpoint")
+        self._attr_current_temperature = data.get(
+            "get_t11_electric_water_heater_temperature"
         )
-        running_state = await self._device.get_electric_water_heater_state()
+        running_state = data.get("get_electric_water_heater_state")
         if running_state == 1:
             self._state = "heating"
         elif self._attr_target_temperature != 0:
@@ -87,6 +95,7 @@ class NilanTopWaterHeater(NilanEntity, WaterHeaterEntity):
             self._attr_current_operation = STATE_ELECTRIC
         else:
             self._attr_current_operation = STATE_OFF
+        super()._handle_coordinator_update()
 
     @property
     def min_temp(self):
@@ -128,31 +137,36 @@ class NilanBottomWaterHeater(NilanEntity, WaterHeaterEntity):
         self._attr_translation_key = "bottom_water_heater"
         self._attr_has_entity_name = True
         self._attr_unique_id = "bottom_water_heater"
+        self.coordinator_context = (
+            "get_compressor_water_heater_setpoint",
+            "get_t12_compressor_water_heater_temperature",
+            "get_control_state",
+        )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
-        await self._device.set_compressor_water_heater_setpoint(
-            kwargs[ATTR_TEMPERATURE]
+        await self.coordinator.async_set(
+            "set_compressor_water_heater_setpoint", kwargs[ATTR_TEMPERATURE]
         )
-        self.async_write_ha_state()
 
     async def async_set_operation_mode(self, operation_mode):
         """Set operation mode."""
         if operation_mode == STATE_OFF:
-            await self._device.set_compressor_water_heater_setpoint(0)
+            await self.coordinator.async_set("set_compressor_water_heater_setpoint", 0)
         else:
-            await self._device.set_compressor_water_heater_setpoint(self._previous_temp)
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Update sensor values."""
-        self._attr_target_temperature = (
-            await self._device.get_compressor_water_heater_setpoint()
-        )
-        self._attr_current_temperature = (
-            await self._device.get_t12_compressor_water_heater_temperature()
+            await self.coordinator.async_set(
+                "set_compressor_water_heater_setpoint", self._previous_temp
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        self._attr_target_temperature = data.get("get_compressor_water_heater_setpoint")
+        self._attr_current_temperature = data.get(
+            "get_t12_compressor_water_heater_temperature"
         )
-        running_state = await self._device.get_control_state()
+        running_state = data.get("get_control_state")
         if running_state in (9, 11, 17):
             self._state = "heating"
         elif self._attr_target_temperature != 0:
@@ -165,6 +179,7 @@ class NilanBottomWaterHeater(NilanEntity, WaterHeaterEntity):
             self._attr_current_operation = STATE_HEAT_PUMP
         else:
             self._attr_current_operation = STATE_OFF
+        super()._handle_coordinator_update()
 
     @property
     def min_temp(self):